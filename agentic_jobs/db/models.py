@@ -4,7 +4,7 @@ import uuid
 from datetime import date, datetime, timezone
 from typing import List, Optional
 
-from sqlalchemy import Date, DateTime, Float, ForeignKey, Integer, String, UniqueConstraint, Text
+from sqlalchemy import Date, DateTime, Float, ForeignKey, Index, Integer, String, UniqueConstraint, Text, text
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -120,6 +120,10 @@ class TrustEvent(Base):
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
     )
 
+    __table_args__ = (
+        Index("ix_trust_events_domain_root_created_at", "domain_root", text("created_at DESC")),
+    )
+
 
 class Whitelist(Base):
     __tablename__ = "whitelist"
@@ -489,6 +493,7 @@ class TrackerView(Base):
     view_type: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
     slack_channel_id: Mapped[str] = mapped_column(String(64), nullable=False)
     slack_message_ts: Mapped[str] = mapped_column(String(32), nullable=False)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(32))
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
     )
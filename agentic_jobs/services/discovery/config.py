@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
@@ -72,6 +73,17 @@ DEFAULT_SCORE_GEO = [
 ]
 
 
+def keyword_pattern(keywords: list[str]) -> re.Pattern[str] | None:
+    """Compile keywords into one literal alternation, or None when empty.
+
+    ``pattern.search(text)`` matches exactly when
+    ``any(keyword in text for keyword in keywords)`` does, in a single scan.
+    """
+    if not keywords:
+        return None
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
 @dataclass(slots=True)
 class JobFilterConfig:
     include_keywords: list[str]
@@ -80,6 +92,15 @@ class JobFilterConfig:
     score_title_keywords: list[str]
     score_new_grad_keywords: list[str]
     score_geo_keywords: list[str]
+    # Compiled once per config; get_job_filter_config caches the config itself.
+    score_title_pattern: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    score_new_grad_pattern: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    score_geo_pattern: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.score_title_pattern = keyword_pattern(self.score_title_keywords)
+        self.score_new_grad_pattern = keyword_pattern(self.score_new_grad_keywords)
+        self.score_geo_pattern = keyword_pattern(self.score_geo_keywords)
 
 
 def _normalize_list(values: Any, fallback: list[str]) -> list[str]:
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Sequence
+from typing import Any, Dict, Sequence
 from urllib.parse import urlparse
 
-from sqlalchemy import or_, select
+from sqlalchemy import exists, insert, or_, select
 from sqlalchemy.orm import Session
 
 from agentic_jobs.config import Settings
@@ -21,8 +22,22 @@ def _slug_to_company(slug: str) -> str:
     parts = slug.replace("_", "-").split("-")
     return " ".join(part.capitalize() for part in parts if part)
 
+
 LOGGER = logging.getLogger(__name__)
 
+# Rows per executemany batch when writing staged discovery rows.
+_INSERT_BATCH_SIZE = 1000
+
+
+@dataclass(slots=True)
+class _PendingRows:
+    """Job/JobSource/TrustEvent rows staged for one bulk insert per org."""
+
+    job_sources: list[dict[str, Any]] = field(default_factory=list)
+    jobs: list[dict[str, Any]] = field(default_factory=list)
+    trust_events: list[dict[str, Any]] = field(default_factory=list)
+    canonical_ids: set[str] = field(default_factory=set)
+    hashes: set[str] = field(default_factory=set)
 
 
 async def run_discovery(
@@ -71,10 +86,7 @@ async def _run_for_adapter(
             summary.orgs_crawled += 1
             summary.jobs_seen += len(job_refs)
 
-            for job_ref in job_refs:
-                inserted = await _ingest_job(session, adapter, job_ref, domain_cache, filter_config)
-                if inserted:
-                    summary.jobs_inserted += 1
+            summary.jobs_inserted += await _ingest_org(session, adapter, job_refs, domain_cache, filter_config)
 
             now = datetime.now(timezone.utc)
             frontier.last_crawled_at = now
@@ -93,10 +105,7 @@ async def _run_for_adapter(
             job_refs = await adapter.list_jobs(slug)
             summary.orgs_crawled += 1
             summary.jobs_seen += len(job_refs)
-            for job_ref in job_refs:
-                inserted = await _ingest_job(session, adapter, job_ref, domain_cache, filter_config)
-                if inserted:
-                    summary.jobs_inserted += 1
+            summary.jobs_inserted += await _ingest_org(session, adapter, job_refs, domain_cache, filter_config)
 
     session.commit()
     return summary, set(domain_cache.keys())
@@ -145,17 +154,38 @@ def _select_frontier(session: Session, adapter: SourceAdapter, limit: int) -> li
     return list(session.execute(stmt).scalars())
 
 
+async def _ingest_org(
+    session: Session,
+    adapter: SourceAdapter,
+    job_refs: Sequence[JobRef],
+    domain_cache: Dict[str, TrustResult],
+    filter_config: JobFilterConfig,
+) -> int:
+    pending = _PendingRows()
+    inserted = 0
+    try:
+        for job_ref in job_refs:
+            if await _ingest_job(session, adapter, job_ref, domain_cache, filter_config, pending):
+                inserted += 1
+    finally:
+        # Write what was found even if a detail fetch fails partway through
+        # the org, so a DiscoveryError does not drop the org's earlier jobs.
+        _write_pending(session, pending)
+    return inserted
+
+
 async def _ingest_job(
     session: Session,
     adapter: SourceAdapter,
     job_ref: JobRef,
     domain_cache: Dict[str, TrustResult],
     filter_config: JobFilterConfig,
+    pending: _PendingRows,
 ) -> bool:
     if not _is_relevant_role(job_ref.title, filter_config):
         return False
     canonical_id = adapter.canonical_id(job_ref)
-    if _job_exists(session, canonical_id):
+    if canonical_id in pending.canonical_ids or _job_exists(session, canonical_id):
         return False
 
     job_detail = await adapter.fetch_job_detail(job_ref)
@@ -175,7 +205,7 @@ async def _ingest_job(
     )
     job_hash = compute_hash(job_ref.title, company_name, hash_payload)
 
-    if _hash_exists(session, job_hash):
+    if job_hash in pending.hashes or _hash_exists(session, job_hash):
         return False
 
     domain_root = urlparse(job_ref.detail_url).netloc.lower()
@@ -199,58 +229,73 @@ async def _ingest_job(
         source_label = getattr(adapter, "source_display_name", getattr(adapter, "source_name", "unknown"))
     source_label = source_label.strip()
 
-    job_source = models.JobSource(
-        source_type=source_type,
-        source_url=job_ref.detail_url,
-        company_name=company_name,
-        domain_root=domain_root,
-        raw_payload=raw_payload,
-        source_name=source_label,
-        hash=job_hash,
-    )
-
     company_website = job_detail.metadata.get("company_website") or None
 
-    job = models.Job(
-        title=job_ref.title,
-        company_name=company_name,
-        location=location,
-        url=job_ref.detail_url,
-        source_type=source_type,
-        source_name=source_label,
-        domain_root=domain_root,
-        submission_mode=submission_mode,
-        jd_text=jd_text,
-        requirements=requirements,
-        company_website=company_website,
-        job_id_canonical=canonical_id,
-        scraped_at=datetime.now(timezone.utc),
-        hash=job_hash,
+    pending.job_sources.append(
+        {
+            "source_type": source_type,
+            "source_url": job_ref.detail_url,
+            "company_name": company_name,
+            "domain_root": domain_root,
+            "raw_payload": raw_payload,
+            "source_name": source_label,
+            "hash": job_hash,
+        }
     )
-
-    trust_event = models.TrustEvent(
-        domain_root=domain_root,
-        url=job_ref.detail_url,
-        score=trust_result.score,
-        signals=trust_result.signals,
-        verdict=trust_result.verdict,
+    pending.jobs.append(
+        {
+            "title": job_ref.title,
+            "company_name": company_name,
+            "location": location,
+            "url": job_ref.detail_url,
+            "source_type": source_type,
+            "source_name": source_label,
+            "domain_root": domain_root,
+            "submission_mode": submission_mode,
+            "jd_text": jd_text,
+            "requirements": requirements,
+            "company_website": company_website,
+            "job_id_canonical": canonical_id,
+            "scraped_at": datetime.now(timezone.utc),
+            "hash": job_hash,
+        }
     )
-
-    session.add(job_source)
-    session.add(job)
-    session.add(trust_event)
-    session.flush()
+    pending.trust_events.append(
+        {
+            "domain_root": domain_root,
+            "url": job_ref.detail_url,
+            "score": trust_result.score,
+            "signals": trust_result.signals,
+            "verdict": trust_result.verdict,
+        }
+    )
+    pending.canonical_ids.add(canonical_id)
+    pending.hashes.add(job_hash)
     return True
 
 
+def _write_pending(session: Session, pending: _PendingRows) -> None:
+    # One executemany per table instead of an ORM flush per job; the pending
+    # id/hash sets above cover dedupe for rows not yet in the database.
+    for model, rows in (
+        (models.JobSource, pending.job_sources),
+        (models.Job, pending.jobs),
+        (models.TrustEvent, pending.trust_events),
+    ):
+        for start in range(0, len(rows), _INSERT_BATCH_SIZE):
+            session.execute(insert(model), rows[start : start + _INSERT_BATCH_SIZE])
+
+
 def _job_exists(session: Session, canonical_id: str) -> bool:
-    stmt = select(models.Job.id).where(models.Job.job_id_canonical == canonical_id)
-    return session.execute(stmt).scalar() is not None
+    # job_id_canonical and hash are both uniquely indexed, so EXISTS stops at
+    # the first index hit here and in _hash_exists.
+    stmt = select(exists().where(models.Job.job_id_canonical == canonical_id))
+    return bool(session.scalar(stmt))
 
 
 def _hash_exists(session: Session, job_hash: str) -> bool:
-    stmt = select(models.Job.id).where(models.Job.hash == job_hash)
-    return session.execute(stmt).scalar() is not None
+    stmt = select(exists().where(models.Job.hash == job_hash))
+    return bool(session.scalar(stmt))
 
 
 async def _evaluate_domain(
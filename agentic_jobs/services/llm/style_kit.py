@@ -254,12 +254,18 @@ def _build_kit(data: dict) -> CoverLetterKit:
 
 
 @lru_cache(maxsize=1)
+def _load_kit_cached(path: str, mtime_ns: int) -> CoverLetterKit:
+    # mtime_ns is only part of the cache key: editing the file invalidates it.
+    return _build_kit(_load_yaml(Path(path)))
+
+
 def load_cover_letter_kit(path: str | Path | None = None) -> CoverLetterKit:
     resolved = Path(path) if path else KIT_PATH
-    if not resolved.exists():
-        raise FileNotFoundError(f"Cover letter kit not found at {resolved}")
-    data = _load_yaml(resolved)
-    return _build_kit(data)
+    try:
+        mtime_ns = resolved.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Cover letter kit not found at {resolved}") from None
+    return _load_kit_cached(str(resolved), mtime_ns)
 
 
 def cover_letter_kit_hash(path: str | Path | None = None) -> str:
@@ -1,3 +1,3 @@
-from .scorer import ScoreResult, score_job
+from .scorer import ScoreResult, score_job, score_jobs
 
-__all__ = ["ScoreResult", "score_job"]
+__all__ = ["ScoreResult", "score_job", "score_jobs"]
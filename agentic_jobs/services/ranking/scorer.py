@@ -1,17 +1,31 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from typing import Sequence
+from uuid import UUID
 
 from agentic_jobs.db import models
 from agentic_jobs.services.discovery.config import JobFilterConfig, get_job_filter_config
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ScoreResult:
     score: float
     rationale: str
 
 
+# Memo of default-config scores keyed on (job id, content hash, config path).
+# The same Job rows are re-scored by the digest, save-to-tracker and
+# application-create paths; the content hash covers every field the score reads.
+_SCORE_MEMO: dict[tuple[UUID, str, str], ScoreResult] = {}
+_SCORE_MEMO_MAX = 8192
+
+
+def _matches(pattern: re.Pattern[str] | None, text: str) -> bool:
+    return pattern is not None and pattern.search(text) is not None
+
+
 def _clamp(value: float, minimum: float = 0.0, maximum: float = 1.0) -> float:
     return max(minimum, min(value, maximum))
 
@@ -21,11 +35,41 @@ def score_job(job: models.Job, filter_config: JobFilterConfig | None = None) ->
 
     Combines title, new-grad phrasing, geo, and remote/hybrid signals from the
     job filter config into a single score with a human-readable rationale.
+    Results for the default config are memoized per job id and content hash.
     """
-    if filter_config is None:
-        from agentic_jobs.config import settings
-        filter_config = get_job_filter_config(settings.job_filter_config_path)
+    return score_jobs([job], filter_config)[0]
 
+
+def score_jobs(
+    jobs: Sequence[models.Job], filter_config: JobFilterConfig | None = None
+) -> list[ScoreResult]:
+    """Score a batch of jobs, resolving the filter config once for the batch.
+
+    Returns results in the same order as ``jobs``; see ``score_job``.
+    """
+    if filter_config is not None:
+        return [_score(job, filter_config) for job in jobs]
+
+    from agentic_jobs.config import settings
+
+    config_path = settings.job_filter_config_path
+    config = get_job_filter_config(config_path)
+    results: list[ScoreResult] = []
+    for job in jobs:
+        key = (job.id, job.hash, config_path)
+        result = _SCORE_MEMO.get(key)
+        if result is None:
+            result = _score(job, config)
+            if job.id is not None and job.hash:
+                if len(_SCORE_MEMO) >= _SCORE_MEMO_MAX:
+                    # Dicts keep insertion order, so this evicts the oldest entry.
+                    _SCORE_MEMO.pop(next(iter(_SCORE_MEMO)))
+                _SCORE_MEMO[key] = result
+        results.append(result)
+    return results
+
+
+def _score(job: models.Job, filter_config: JobFilterConfig) -> ScoreResult:
     score = 0.3
     reasons: list[str] = []
 
@@ -33,15 +77,15 @@ def score_job(job: models.Job, filter_config: JobFilterConfig | None = None) ->
     text = job.jd_text.lower()
     location = job.location.lower()
 
-    if any(keyword in title for keyword in filter_config.score_title_keywords):
+    if _matches(filter_config.score_title_pattern, title):
         score += 0.25
         reasons.append("title fit")
 
-    if any(keyword in text for keyword in filter_config.score_new_grad_keywords):
+    if _matches(filter_config.score_new_grad_pattern, text):
         score += 0.25
         reasons.append("new grad phrase")
 
-    if any(keyword in location for keyword in filter_config.score_geo_keywords):
+    if _matches(filter_config.score_geo_pattern, location):
         score += 0.1
         reasons.append("geo boost")
 
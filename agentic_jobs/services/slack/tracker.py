@@ -1,15 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Iterable
 from uuid import UUID
 
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 
 from agentic_jobs.config import settings
 from agentic_jobs.core.enums import ApplicationStage, AutofillTaskStatus
@@ -33,6 +33,16 @@ STAGE_SUMMARY_ORDER: list[ApplicationStage] = [
 ]
 
 
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _format_timestamp(value: datetime) -> str:
+    """Format as "Oct 05 · 14:30 UTC" without strftime's per-call locale lookups."""
+    if value.tzinfo != timezone.utc:
+        value = value.astimezone(timezone.utc)
+    return f"{_MONTHS[value.month - 1]} {value.day:02d} · {value.hour:02d}:{value.minute:02d} UTC"
+
+
 @dataclass(slots=True)
 class TrackerRow:
     application_id: UUID
@@ -69,11 +79,17 @@ class MasterTracker:
         existing_views = self._get_views()
         used_keys: set[str] = set()
         now = datetime.now(tz=timezone.utc)
+        timestamp = _format_timestamp(now)
 
         for index, page_rows in enumerate(pages, start=1):
             view_key = self._view_type_for_page(index)
-            blocks = self._build_blocks(page_rows, stage_counts, total_active, index, total_pages)
+            blocks = self._build_blocks(page_rows, stage_counts, total_active, index, total_pages, timestamp)
+            content_hash = self._content_hash(blocks, total_active, total_pages)
             view = existing_views.get(view_key)
+            if view and view.slack_message_ts and view.content_hash == content_hash:
+                # Nothing on this page changed since the last push; skip the Slack call.
+                used_keys.add(view_key)
+                continue
             if not view or not view.slack_message_ts:
                 response = await self.slack_client.post_message(
                     channel=channel_id,
@@ -118,6 +134,7 @@ class MasterTracker:
                         LOGGER.warning("Failed to post replacement tracker page %s: %s", view_key, post_err)
                         continue
             view.view_type = view_key
+            view.content_hash = content_hash
             view.updated_at = now
             used_keys.add(view_key)
 
@@ -134,45 +151,35 @@ class MasterTracker:
 
     def _load_rows(self) -> list[TrackerRow]:
         archived_values = [stage.value for stage in ARCHIVED_STAGES]
+        # Column select in TrackerRow field order: rows map straight onto the
+        # dataclass without hydrating Application/Job ORM instances.
         stmt = (
-            select(models.Application)
-            .options(joinedload(models.Application.job))
+            select(
+                models.Application.id,
+                models.Application.human_id,
+                models.Application.stage,
+                models.Application.score,
+                models.Application.updated_at,
+                models.Job.title,
+                models.Job.company_name,
+                models.Job.location,
+                models.Job.url,
+            )
+            .join(models.Job, models.Application.job_id == models.Job.id)
             .where(models.Application.stage.notin_(archived_values))
             .order_by(models.Application.updated_at.desc())
             .limit(settings.tracker_rows_per_page * settings.tracker_max_pages)
         )
-        apps = self.session.execute(stmt).scalars().all()
-        rows: list[TrackerRow] = []
-        for app in apps:
-            job = app.job
-            if not job:
-                continue
-            rows.append(
-                TrackerRow(
-                    application_id=app.id,
-                    human_id=app.human_id,
-                    stage=app.stage,
-                    score=app.score,
-                    updated_at=app.updated_at,
-                    job_title=job.title,
-                    company=job.company_name,
-                    location=job.location,
-                    url=job.url,
-                )
-            )
-        return rows
+        return [TrackerRow(*row) for row in self.session.execute(stmt)]
 
-    def _count_active_stages(self) -> Counter[str]:
+    def _count_active_stages(self) -> dict[str, int]:
         archived_values = [stage.value for stage in ARCHIVED_STAGES]
         stmt = (
             select(models.Application.stage, func.count())
             .where(models.Application.stage.notin_(archived_values))
             .group_by(models.Application.stage)
         )
-        counts: Counter[str] = Counter()
-        for stage_value, count in self.session.execute(stmt):
-            counts[stage_value] = count
-        return counts
+        return {stage_value: count for stage_value, count in self.session.execute(stmt)}
 
     def _count_queued_autofill_tasks(self) -> int:
         stmt = select(func.count()).select_from(models.AutofillTask).where(
@@ -198,18 +205,18 @@ class MasterTracker:
     def _build_blocks(
         self,
         rows: Iterable[TrackerRow],
-        stage_counts: Counter[str],
+        stage_counts: dict[str, int],
         total_active: int,
         page_index: int,
         total_pages: int,
+        timestamp: str,
     ) -> list[dict]:
-        now_str = datetime.now(tz=timezone.utc).strftime("%b %d · %H:%M UTC")
         blocks: list[dict] = [
             {
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": self._header_text(total_active, page_index, total_pages, now_str),
+                    "text": self._header_text(total_active, page_index, total_pages, timestamp),
                 },
             }
         ]
@@ -298,7 +305,7 @@ class MasterTracker:
 
     def _build_row_block(self, row: TrackerRow) -> dict:
         score_display = f"`{row.score:.2f}`" if row.score is not None else "`—`"
-        updated_str = row.updated_at.astimezone(timezone.utc).strftime("%b %d · %H:%M UTC")
+        updated_str = _format_timestamp(row.updated_at)
         text = (
             f"*{row.job_title}* · {row.company}\n"
             f"Stage: `{stage_display(row.stage)}` · Score: {score_display}\n"
@@ -316,6 +323,12 @@ class MasterTracker:
             },
         }
 
+    def _content_hash(self, blocks: list[dict], total_active: int, total_pages: int) -> str:
+        # The header block carries a "Last updated" timestamp that differs on every
+        # refresh, so hash the values it is built from instead of its text.
+        payload = json.dumps([total_active, total_pages, blocks[1:]], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
     def _chunk_rows(self, rows: list[TrackerRow]) -> list[list[TrackerRow]]:
         page_size = settings.tracker_rows_per_page
         chunks: list[list[TrackerRow]] = []
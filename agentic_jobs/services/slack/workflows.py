@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from typing import Iterable
@@ -9,7 +10,7 @@ from sqlalchemy.orm import Session
 
 from agentic_jobs.core.enums import DomainReviewStatus
 from agentic_jobs.db import models
-from agentic_jobs.services.ranking import score_job
+from agentic_jobs.services.ranking import score_jobs
 from agentic_jobs.services.slack.digest import DigestRow, NeedsReviewCard
 from agentic_jobs.services.trust.whitelist import apply_auto_whitelist, lookup_auto_whitelist
 
@@ -38,13 +39,10 @@ def collect_digest_rows(
     if since is not None:
         stmt = stmt.where(models.Job.scraped_at > since)
 
-    jobs = list(session.execute(stmt).scalars())
+    jobs = [job for job in session.execute(stmt).scalars() if job.id not in posted_job_ids]
 
     rows: list[DigestRow] = []
-    for job in jobs:
-        if job.id in posted_job_ids:
-            continue
-        score_result = score_job(job)
+    for job, score_result in zip(jobs, score_jobs(jobs)):
         rows.append(
             DigestRow(
                 job_id=job.id,
@@ -59,8 +57,10 @@ def collect_digest_rows(
             )
         )
 
-    rows.sort(key=lambda row: row.score, reverse=True)
-    return rows[:limit]
+    # Scores come from config-driven keyword matching and can't be expressed in
+    # SQL, so rank in Python. nlargest is O(n log k) and, like a stable
+    # reverse sort, keeps the scraped_at-desc order among equal scores.
+    return heapq.nlargest(limit, rows, key=lambda row: row.score)
 
 
 def record_digest_post(
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import hashlib
-import re
+import threading
 from html.parser import HTMLParser
-from typing import Any
+from typing import Any, Callable, TypeVar
 
 
 class _HTMLStripper(HTMLParser):
@@ -23,8 +23,8 @@ class _HTMLStripper(HTMLParser):
     }
     IGNORE_TAGS = {"script", "style", "noscript"}
 
-    def __init__(self) -> None:
-        super().__init__()
+    def reset(self) -> None:
+        super().reset()
         self._parts: list[str] = []
         self._ignore_depth = 0
 
@@ -48,14 +48,35 @@ class _HTMLStripper(HTMLParser):
 
     def get_text(self) -> str:
         combined = "".join(self._parts)
-        lines = [re.sub(r"\s+", " ", line).strip() for line in combined.splitlines()]
-        filtered = [line for line in lines if line]
-        return "\n".join(filtered)
+        lines: list[str] = []
+        for line in combined.splitlines():
+            # split()/join collapses whitespace runs and strips ends without regex.
+            normalized = " ".join(line.split())
+            if normalized:
+                lines.append(normalized)
+        return "\n".join(lines)
+
+
+_ParserT = TypeVar("_ParserT", bound=HTMLParser)
+
+# HTMLParser construction isn't free, so each thread keeps one parser of each
+# kind and resets it between documents.
+_parsers = threading.local()
+
+
+def _pooled_parser(name: str, factory: Callable[[], _ParserT]) -> _ParserT:
+    parser = getattr(_parsers, name, None)
+    if parser is None:
+        parser = factory()
+        setattr(_parsers, name, parser)
+    else:
+        parser.reset()
+    return parser
 
 
 def html_to_text(html: str) -> str:
     """Convert HTML into normalized plain text."""
-    stripper = _HTMLStripper()
+    stripper = _pooled_parser("stripper", _HTMLStripper)
     stripper.feed(html)
     stripper.close()
     return stripper.get_text()
@@ -64,8 +85,8 @@ def html_to_text(html: str) -> str:
 class _RequirementExtractor(HTMLParser):
     IGNORE_TAGS = {"script", "style", "noscript"}
 
-    def __init__(self) -> None:
-        super().__init__()
+    def reset(self) -> None:
+        super().reset()
         self._ignore_depth = 0
         self._in_li = False
         self._buffer: list[str] = []
@@ -87,9 +108,8 @@ class _RequirementExtractor(HTMLParser):
             self._ignore_depth -= 1
             return
         if self._ignore_depth == 0 and tag == "li" and self._in_li:
-            text = "".join(self._buffer).strip()
-            if text:
-                normalized = re.sub(r"\s+", " ", text)
+            normalized = " ".join("".join(self._buffer).split())
+            if normalized:
                 self.items.append(normalized)
             self._in_li = False
             self._buffer = []
@@ -101,7 +121,7 @@ class _RequirementExtractor(HTMLParser):
 
 def extract_requirements(html: str) -> list[dict[str, Any]]:
     """Extract bullet-list requirements from job description HTML."""
-    parser = _RequirementExtractor()
+    parser = _pooled_parser("requirements", _RequirementExtractor)
     parser.feed(html)
     parser.close()
 
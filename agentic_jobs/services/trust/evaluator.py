@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from agentic_jobs.core.enums import TrustVerdict
 from agentic_jobs.services.trust.whitelist import lookup_auto_whitelist
 
 
+_WHITELIST_MATCH_SIGNAL = ("whitelist", "match")
+_WHITELIST_NONE_SIGNAL = ("whitelist", "none")
+
+
 @dataclass(slots=True)
 class TrustResult:
     score: int
@@ -14,20 +19,25 @@ class TrustResult:
     signals: list[dict[str, str]] = field(default_factory=list)
 
 
-async def evaluate(url: str, domain_root: str) -> TrustResult:
-    host = (domain_root or urlparse(url).netloc).lower()
+@lru_cache(maxsize=1024)
+def _evaluate_host(host: str) -> tuple[int, TrustVerdict, tuple[tuple[str, str], ...]]:
+    # The verdict depends only on the host (the auto-whitelist is static), so it is
+    # memoized per host. Signals are cached as immutable (name, value) pairs and
+    # evaluate() builds fresh dicts per call, so callers can't corrupt the cache.
     entry = lookup_auto_whitelist(host)
-
     if entry is not None:
-        signals = [
-            {"signal": "host", "value": host},
-            {"signal": "ats_type", "value": entry.ats_type},
-            {"signal": "whitelist", "value": "match"},
-        ]
-        return TrustResult(score=90, verdict=TrustVerdict.AUTO_SAFE, signals=signals)
-
-    signals = [
-        {"signal": "host", "value": host},
-        {"signal": "whitelist", "value": "none"},
-    ]
-    return TrustResult(score=30, verdict=TrustVerdict.NEEDS_HUMAN_APPROVAL, signals=signals)
+        signals = (("host", host), ("ats_type", entry.ats_type), _WHITELIST_MATCH_SIGNAL)
+        return 90, TrustVerdict.AUTO_SAFE, signals
+
+    signals = (("host", host), _WHITELIST_NONE_SIGNAL)
+    return 30, TrustVerdict.NEEDS_HUMAN_APPROVAL, signals
+
+
+async def evaluate(url: str, domain_root: str) -> TrustResult:
+    host = (domain_root or urlparse(url).netloc).lower()
+    score, verdict, signals = _evaluate_host(host)
+    return TrustResult(
+        score=score,
+        verdict=verdict,
+        signals=[{"signal": name, "value": value} for name, value in signals],
+    )
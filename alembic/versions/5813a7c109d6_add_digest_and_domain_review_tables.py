@@ -17,17 +17,11 @@ down_revision: Union[str, None] = '4c6ab7c24da4'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Plain VARCHAR + CHECK; the ORM's non-native Enum stores member names.
+_STATUS_CHECK = "status IN ('PENDING', 'APPROVED', 'MUTED')"
 
-def upgrade() -> None:
-    status_enum = sa.Enum(
-        'PENDING',
-        'APPROVED',
-        'MUTED',
-        name='domain_review_status',
-        native_enum=False,
-    )
-    status_enum.create(op.get_bind(), checkfirst=True)
 
+def upgrade() -> None:
     op.create_table(
         'digest_logs',
         sa.Column('id', sa.UUID(), nullable=False),
@@ -45,7 +39,7 @@ def upgrade() -> None:
         'domain_reviews',
         sa.Column('id', sa.UUID(), nullable=False),
         sa.Column('domain_root', sa.String(length=255), nullable=False),
-        sa.Column('status', status_enum, nullable=False),
+        sa.Column('status', sa.String(length=32), nullable=False),
         sa.Column('slack_channel_id', sa.String(length=64), nullable=True),
         sa.Column('slack_message_ts', sa.String(length=32), nullable=True),
         sa.Column('company_name', sa.String(length=255), nullable=True),
@@ -56,18 +50,10 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('domain_root'),
+        sa.CheckConstraint(_STATUS_CHECK, name='ck_domain_reviews_status'),
     )
 
 
 def downgrade() -> None:
     op.drop_table('domain_reviews')
     op.drop_table('digest_logs')
-
-    status_enum = sa.Enum(
-        'PENDING',
-        'APPROVED',
-        'MUTED',
-        name='domain_review_status',
-        native_enum=False,
-    )
-    status_enum.drop(op.get_bind(), checkfirst=True)
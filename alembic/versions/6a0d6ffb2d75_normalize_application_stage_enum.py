@@ -5,6 +5,7 @@ Revises: 3d7a1d611b3c
 Create Date: 2024-12-18 00:30:00.000000
 
 """
+import uuid
 from typing import Sequence, Union
 
 from alembic import op
@@ -18,10 +19,39 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# Rows rewritten per statement; each batch commits on its own so locks and WAL
+# per transaction stay bounded on large tables.
+_BATCH_SIZE = 10_000
+
+
+def _recase_stage(func: str) -> None:
+    # Only touch rows whose casing actually differs, so already-normalized tuples
+    # are never rewritten.
+    if op.get_context().as_sql:
+        op.execute(f"UPDATE applications SET stage = {func}(stage) WHERE stage <> {func}(stage)")
+        return
+
+    # Keyset on id: each batch starts after the last id it rewrote, so no batch
+    # rescans rows an earlier one already walked past.
+    stmt = sa.text(
+        f"UPDATE applications SET stage = {func}(stage) "
+        f"WHERE id IN (SELECT id FROM applications WHERE stage <> {func}(stage) AND id > :last "
+        f"ORDER BY id LIMIT :batch_size) RETURNING id"
+    ).bindparams(sa.bindparam("last", type_=sa.Uuid())).columns(sa.column("id", sa.Uuid()))
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        last = uuid.UUID(int=0)
+        while True:
+            ids = bind.execute(stmt, {"last": last, "batch_size": _BATCH_SIZE}).scalars().all()
+            if not ids:
+                break
+            last = max(ids)
+
+
 def upgrade() -> None:
     # Normalize any stray uppercase values back to lowercase to match enum values.
-    op.execute("UPDATE applications SET stage = lower(stage)")
+    _recase_stage("lower")
 
 
 def downgrade() -> None:
-    op.execute("UPDATE applications SET stage = upper(stage)")
+    _recase_stage("upper")
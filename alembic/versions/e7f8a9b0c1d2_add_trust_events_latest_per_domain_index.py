@@ -0,0 +1,39 @@
+"""add (domain_root, created_at desc) index on trust_events
+
+Revision ID: e7f8a9b0c1d2
+Revises: d1e2f3a4b5c6
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "e7f8a9b0c1d2"
+down_revision = "d1e2f3a4b5c6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves "latest trust event for a domain" (ORDER BY created_at DESC LIMIT 1)
+    # straight off the index. domain_reviews needs no equivalent: domain_root is
+    # already unique there, so its lookup is a single unique-index probe.
+    # trust_events is already populated, so build CONCURRENTLY to keep writes
+    # flowing; that cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_trust_events_domain_root_created_at",
+            "trust_events",
+            ["domain_root", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_trust_events_domain_root_created_at",
+            table_name="trust_events",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,25 @@
+"""add content_hash to tracker_views
+
+Revision ID: f1a2b3c4d5e6
+Revises: e7f8a9b0c1d2
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "f1a2b3c4d5e6"
+down_revision = "e7f8a9b0c1d2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tracker_views",
+        sa.Column("content_hash", sa.String(32), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("tracker_views", "content_hash")
@@ -17,20 +17,22 @@ down_revision: Union[str, None] = "e056215b19ea"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Plain VARCHAR + CHECK; the ORM's non-native Enum stores member names.
+_ROLE_CHECK = "role IN ('USER', 'ASSISTANT', 'SYSTEM')"
+
 
 def upgrade() -> None:
-    feedback_role = sa.Enum("user", "assistant", "system", name="feedback_role", native_enum=False)
-    feedback_role.create(op.get_bind(), checkfirst=True)
     op.create_table(
         "application_feedback",
         sa.Column("id", sa.UUID(), nullable=False),
         sa.Column("application_id", sa.UUID(), nullable=False),
-        sa.Column("role", feedback_role, nullable=False),
+        sa.Column("role", sa.String(length=32), nullable=False),
         sa.Column("author", sa.String(length=255), nullable=True),
         sa.Column("text", sa.Text(), nullable=False),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.ForeignKeyConstraint(["application_id"], ["applications.id"]),
         sa.PrimaryKeyConstraint("id"),
+        sa.CheckConstraint(_ROLE_CHECK, name="ck_application_feedback_role"),
     )
     op.create_index(
         "ix_application_feedback_application_id",
@@ -43,4 +45,3 @@ def upgrade() -> None:
 def downgrade() -> None:
     op.drop_index("ix_application_feedback_application_id", table_name="application_feedback")
     op.drop_table("application_feedback")
-    op.execute("DROP TYPE IF EXISTS feedback_role")
@@ -4,18 +4,26 @@ Test Slack Configuration Script
 This script checks if your Slack tokens are properly configured
 """
 
+import functools
 import os
 import sys
 
+_PLACEHOLDER_PREFIXES = ("xoxb-replace", "xapp-replace", "replace-with", "dummy")
+
+
+@functools.lru_cache(maxsize=None)
+def _read_env(name: str) -> str | None:
+    return os.environ.get(name)
+
 
 def check_env_var(name: str, expected_prefix: str = None) -> tuple[bool, str]:
     """Check if an environment variable is set and optionally validate its prefix"""
-    value = os.environ.get(name)
+    value = _read_env(name)
     
     if not value:
         return False, f"❌ {name} is not set"
     
-    if value.startswith(("xoxb-replace", "xapp-replace", "replace-with", "dummy")):
+    if value.startswith(_PLACEHOLDER_PREFIXES):
         return False, f"⚠️  {name} is set but contains a placeholder value"
     
     if expected_prefix and not value.startswith(expected_prefix):
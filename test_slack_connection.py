@@ -5,6 +5,7 @@ This script tests if your Slack tokens can actually connect to Slack
 """
 
 import asyncio
+import functools
 import os
 import sys
 import ssl
@@ -12,9 +13,20 @@ import ssl
 import certifi
 
 
+@functools.lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """Resolve the certifi bundle once and share one SSL context per process."""
+    ca_file = certifi.where()
+    os.environ.setdefault("SSL_CERT_FILE", ca_file)
+    return ssl.create_default_context(cafile=ca_file)
+
+
 async def test_slack_connection():
     """Test the Slack socket mode connection"""
     from agentic_jobs.config import settings
+
+    bot_token = settings.slack_bot_token
+    app_token = settings.slack_app_level_token
     
     print("=" * 60)
     print("Testing Slack Socket Mode Connection")
@@ -22,18 +34,18 @@ async def test_slack_connection():
     print()
     
     # Check if tokens are set
-    if not settings.slack_bot_token:
+    if not bot_token:
         print("❌ SLACK_BOT_TOKEN is not set")
         print("   Please set your environment variables first.")
         return False
     
-    if not settings.slack_app_level_token:
+    if not app_token:
         print("❌ SLACK_APP_LEVEL_TOKEN is not set")
         print("   Please set your environment variables first.")
         return False
     
-    print(f"✅ Bot Token: {settings.slack_bot_token[:10]}...{settings.slack_bot_token[-5:]}")
-    print(f"✅ App Token: {settings.slack_app_level_token[:10]}...{settings.slack_app_level_token[-5:]}")
+    print(f"✅ Bot Token: {bot_token[:10]}...{bot_token[-5:]}")
+    print(f"✅ App Token: {app_token[:10]}...{app_token[-5:]}")
     print()
     
     # Test the connection
@@ -44,9 +56,7 @@ async def test_slack_connection():
         print("🔄 Testing Slack API connection...")
         
         # Test Bot Token
-        os.environ.setdefault("SSL_CERT_FILE", certifi.where())
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        web_client = AsyncWebClient(token=settings.slack_bot_token, ssl=ssl_context)
+        web_client = AsyncWebClient(token=bot_token, ssl=_ssl_context())
         auth_response = await web_client.auth_test()
         
         if auth_response["ok"]:
@@ -65,9 +75,9 @@ async def test_slack_connection():
         print()
         print("🔄 Testing Socket Mode connection...")
         
-        # Test Socket Mode
+        # Test Socket Mode (reuses web_client and its SSL context)
         socket_client = SocketModeClient(
-            app_token=settings.slack_app_level_token,
+            app_token=app_token,
             web_client=web_client,
         )
         
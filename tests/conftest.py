@@ -1,7 +1,10 @@
 import asyncio
+import functools
+import itertools
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Optional
+from typing import AsyncIterator, Callable, Iterator, Optional
 
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
@@ -9,12 +12,18 @@ if str(ROOT) not in sys.path:
 
 import httpx
 import pytest
-from sqlalchemy import create_engine
+import pytest_asyncio
+from pydantic_core import from_json
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.compiler import compiles
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from agentic_jobs.config import Settings
+from agentic_jobs.core.enums import JobSourceType, SubmissionMode
+from agentic_jobs.db import models
 from agentic_jobs.db.session import Base
 from agentic_jobs.services.discovery.github_adapter import GithubPositionsAdapter
 from agentic_jobs.services.discovery.rate_limiter import AsyncRateLimiter
@@ -28,12 +37,32 @@ def compile_jsonb_sqlite(element, compiler, **kw):
     return "JSON"
 
 
+@functools.lru_cache(maxsize=None)
+def _read_fixture(filename: str) -> str:
+    return (FIXTURES_DIR / filename).read_text(encoding="utf-8")
+
+
+def _run_async(loop: asyncio.AbstractEventLoop, *coros) -> None:
+    """Run teardown coroutines together on ``loop`` instead of one loop each."""
+    async def _gather() -> None:
+        await asyncio.gather(*coros, return_exceptions=True)
+
+    loop.run_until_complete(_gather())
+
+
 @pytest.fixture
-def load_fixture() -> Callable[[str], str]:
-    def _loader(filename: str) -> str:
-        return (FIXTURES_DIR / filename).read_text(encoding="utf-8")
+def aio() -> Iterator[asyncio.AbstractEventLoop]:
+    """One event loop per test, shared by the test body and adapter fixture teardown."""
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop
+    finally:
+        loop.close()
 
-    return _loader
+
+@pytest.fixture(scope="session")
+def load_fixture() -> Callable[[str], str]:
+    return _read_fixture
 
 
 @pytest.fixture
@@ -54,92 +83,242 @@ def test_settings(tmp_path) -> Settings:
     )
 
 
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient per session; entering it runs app startup/shutdown once."""
+    from fastapi.testclient import TestClient
+
+    from agentic_jobs.config import settings
+    from agentic_jobs.main import app
+
+    # Keep startup from reaching Slack, the scheduler or the vault embedder.
+    overrides = {
+        "slack_bot_token": None,
+        "slack_app_level_token": None,
+        "environment": "test",
+        "vault_path": "",
+    }
+    original = {name: getattr(settings, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+
+    try:
+        with TestClient(app) as test_client:
+            # Warm up routing and the response path once per (xdist) worker so the
+            # first real test doesn't absorb it.
+            test_client.get("/healthz")
+            yield test_client
+    finally:
+        for name, value in original.items():
+            setattr(settings, name, value)
+
+
+def _assert_ok(response: httpx.Response, expected=None):
+    """Assert a 200 (showing the body on failure) and return the decoded JSON."""
+    assert response.status_code == 200, response.text
+    data = from_json(response.content)
+    if expected is not None:
+        assert data == expected
+    return data
+
+
+@pytest.fixture(scope="session")
+def assert_ok() -> Callable[..., object]:
+    return _assert_ok
+
+
 @pytest.fixture
-def sqlite_session(tmp_path) -> Session:
+def override_dep():
+    """Set FastAPI dependency overrides that are removed after the test."""
+    from agentic_jobs.main import app
+
+    added: list = []
+
+    def _set(dependency, implementation) -> None:
+        app.dependency_overrides[dependency] = implementation
+        added.append(dependency)
+
+    try:
+        yield _set
+    finally:
+        for dependency in added:
+            app.dependency_overrides.pop(dependency, None)
+
+
+@pytest.fixture(scope="session")
+def sqlite_engine() -> Iterator[Engine]:
+    """In-memory database with the schema built once per test session."""
     engine = create_engine(
-        f"sqlite+pysqlite:///{(tmp_path / 'sqlite.db').as_posix()}",
+        "sqlite+pysqlite:///:memory:",
         future=True,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
+
+    # Let SQLAlchemy own BEGIN so pysqlite does not break SAVEPOINT handling.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn) -> None:
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
 
-    TestingSession = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
-    session = TestingSession()
+
+@pytest.fixture
+def sqlite_session(sqlite_engine: Engine) -> Iterator[Session]:
+    """Session whose commits land in a SAVEPOINT rolled back after each test."""
+    connection = sqlite_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
 
     try:
         yield session
     finally:
         session.close()
-        Base.metadata.drop_all(engine)
-        engine.dispose()
+        transaction.rollback()
+        connection.close()
+
+
+# Fields shared by every test job; unique keys come from _job_numbers.
+_JOB_DEFAULTS = {
+    "title": "Software Engineer",
+    "company_name": "ExampleCo",
+    "location": "Remote",
+    "source_type": JobSourceType.COMPANY,
+    "source_name": "Example Source",
+    "domain_root": "example.com",
+    "submission_mode": SubmissionMode.DEEPLINK,
+    "jd_text": "Build services.",
+}
+_job_numbers = itertools.count(1)
+# One timestamp for default scraped_at values keeps job setup deterministic.
+_NOW = datetime.now(timezone.utc)
+
+
+def _create_job(session: Session, *, commit: bool = True, **overrides) -> models.Job:
+    number = next(_job_numbers)
+    fields = {
+        **_JOB_DEFAULTS,
+        "url": f"https://example.com/jobs/{number}",
+        "requirements": [{"type": "bullet", "value": "Python"}],
+        "job_id_canonical": f"SRC:{number}",
+        "scraped_at": _NOW,
+        "hash": f"hash-{number}",
+        **overrides,
+    }
+    job = models.Job(**fields)
+    session.add(job)
+    if not commit:
+        # Flush only, so callers can batch several rows into one commit.
+        session.flush()
+        return job
+    session.commit()
+    session.refresh(job)
+    return job
 
 
 @pytest.fixture
-def mock_transport_factory(load_fixture: Callable[[str], str]):
+def job_factory(sqlite_session: Session) -> Callable[..., models.Job]:
+    """Create a Job in ``sqlite_session``; keyword args override defaults.
+
+    Pass ``commit=False`` to flush without committing.
+    """
+    return functools.partial(_create_job, sqlite_session)
+
+
+@pytest.fixture
+def mock_transport_factory():
     def _factory(overrides: Optional[dict[str, httpx.Response]] = None) -> httpx.MockTransport:
-        sitemap = load_fixture("gh_sitemap.xml")
-        board_json = load_fixture("gh_board_json.json")
-        board_html = load_fixture("gh_board_html.html")
-        job_detail_engineer = load_fixture("gh_job_detail_engineer.html")
-        job_detail_fullstack = load_fixture("gh_job_detail_fullstack.html")
+        board_html = _read_fixture("gh_board_html.html")
+        # path -> (status, body, content type); a fresh Response is built per request.
+        routes: dict[str, tuple[int, Optional[str], Optional[str]]] = {
+            "/robots.txt": (200, "User-agent: *\nAllow: /\n", None),
+            "/sitemap.xml": (200, _read_fixture("gh_sitemap.xml"), "application/xml"),
+            "/testorg/embed/job_board/json": (200, _read_fixture("gh_board_json.json"), "application/json"),
+            "/example-startup/embed/job_board/json": (404, None, None),
+            "/example-startup": (200, board_html, "text/html"),
+            "/testorg": (200, board_html, "text/html"),
+            "/testorg/jobs/12345": (200, _read_fixture("gh_job_detail_engineer.html"), "text/html"),
+            "/testorg/jobs/67890": (200, _read_fixture("gh_job_detail_fullstack.html"), "text/html"),
+        }
 
         async def handler(request: httpx.Request) -> httpx.Response:
             key = (request.method, request.url.path)
             if overrides and key in overrides:
                 return overrides[key]
 
-            if request.url.path == "/robots.txt":
-                return httpx.Response(200, text="User-agent: *\nAllow: /\n")
-            if request.url.path == "/sitemap.xml":
-                return httpx.Response(200, text=sitemap, headers={"Content-Type": "application/xml"})
-            if request.url.path == "/testorg/embed/job_board/json":
-                return httpx.Response(
-                    200,
-                    text=board_json,
-                    headers={"Content-Type": "application/json"},
-                )
-            if request.url.path == "/example-startup/embed/job_board/json":
+            route = routes.get(request.url.path)
+            if route is None:
                 return httpx.Response(404)
-            if request.url.path == "/example-startup":
-                return httpx.Response(200, text=board_html, headers={"Content-Type": "text/html"})
-            if request.url.path == "/testorg":
-                return httpx.Response(200, text=board_html, headers={"Content-Type": "text/html"})
-            if request.url.path == "/testorg/jobs/12345":
-                return httpx.Response(200, text=job_detail_engineer, headers={"Content-Type": "text/html"})
-            if request.url.path == "/testorg/jobs/67890":
-                return httpx.Response(200, text=job_detail_fullstack, headers={"Content-Type": "text/html"})
-            return httpx.Response(404)
+            status_code, text, content_type = route
+            headers = {"Content-Type": content_type} if content_type else None
+            return httpx.Response(status_code, text=text, headers=headers)
 
         return httpx.MockTransport(handler)
 
     return _factory
 
 
+def _github_transport(overrides: Optional[dict[str, httpx.Response]] = None) -> httpx.MockTransport:
+    # (path substring, JSON body) pairs, scanned in order per request.
+    routes = (
+        ("SimplifyJobs", _read_fixture("simplify_positions.json")),
+        ("vanshb03", _read_fixture("new_grad_positions.json")),
+    )
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        key = (request.method, request.url.path)
+        if overrides and key in overrides:
+            return overrides[key]
+
+        path = request.url.path
+        for marker, body in routes:
+            if marker in path:
+                return httpx.Response(200, text=body, headers={"Content-Type": "application/json"})
+
+        return httpx.Response(404)
+
+    return httpx.MockTransport(handler)
+
+
 @pytest.fixture
-def github_transport_factory(load_fixture: Callable[[str], str]):
-    def _factory(overrides: Optional[dict[str, httpx.Response]] = None) -> httpx.MockTransport:
-        simplify = load_fixture("simplify_positions.json")
-        new_grad = load_fixture("new_grad_positions.json")
+def github_transport_factory():
+    return _github_transport
 
-        async def handler(request: httpx.Request) -> httpx.Response:
-            key = (request.method, request.url.path)
-            if overrides and key in overrides:
-                return overrides[key]
 
-            if "SimplifyJobs" in request.url.path:
-                return httpx.Response(200, text=simplify, headers={"Content-Type": "application/json"})
-            if "vanshb03" in request.url.path:
-                return httpx.Response(200, text=new_grad, headers={"Content-Type": "application/json"})
+# Per-test overrides read by the shared GitHub client's transport.
+_GITHUB_OVERRIDES: dict[tuple[str, str], httpx.Response] = {}
 
-            return httpx.Response(404)
 
-        return httpx.MockTransport(handler)
+@pytest_asyncio.fixture(scope="session")
+async def github_client() -> AsyncIterator[httpx.AsyncClient]:
+    """One mock GitHub client for the session; the transport is deterministic."""
+    async with httpx.AsyncClient(transport=_github_transport(_GITHUB_OVERRIDES)) as client:
+        yield client
 
-    return _factory
+
+@pytest.fixture
+def github_overrides() -> dict[tuple[str, str], httpx.Response]:
+    try:
+        yield _GITHUB_OVERRIDES
+    finally:
+        _GITHUB_OVERRIDES.clear()
 
 
 @pytest.fixture
 def greenhouse_adapter(
-    test_settings: Settings, mock_transport_factory
+    test_settings: Settings, mock_transport_factory, aio: asyncio.AbstractEventLoop
 ) -> GreenhouseAdapter:
     transport = mock_transport_factory()
     client = httpx.AsyncClient(transport=transport)
@@ -149,13 +328,12 @@ def greenhouse_adapter(
     try:
         yield adapter
     finally:
-        asyncio.run(adapter.aclose())
-        asyncio.run(client.aclose())
+        _run_async(aio, adapter.aclose(), client.aclose())
 
 
 @pytest.fixture
 def github_adapters(
-    test_settings: Settings, github_transport_factory
+    test_settings: Settings, github_transport_factory, aio: asyncio.AbstractEventLoop
 ):
     transport = github_transport_factory()
     client = httpx.AsyncClient(transport=transport)
@@ -184,6 +362,4 @@ def github_adapters(
     try:
         yield adapters
     finally:
-        for adapter in adapters:
-            asyncio.run(adapter.aclose())
-        asyncio.run(client.aclose())
+        _run_async(aio, *(adapter.aclose() for adapter in adapters), client.aclose())
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
 
 import pytest
@@ -8,6 +7,7 @@ from sqlalchemy import select
 
 from agentic_jobs.core.enums import JobSourceType, SubmissionMode, TrustVerdict
 from agentic_jobs.db import models
+from agentic_jobs.services.discovery.base import DiscoveryError, JobDetail, JobRef
 from agentic_jobs.services.discovery.orchestrator import run_discovery
 
 # Permissive filter so the pipeline tests insert every fixture job regardless of
@@ -15,13 +15,13 @@ from agentic_jobs.services.discovery.orchestrator import run_discovery
 _TEST_FILTER_CONFIG = str(Path(__file__).resolve().parent.parent / "fixtures" / "job_filters_test.yaml")
 
 
-def test_discover_from_sitemap_returns_slugs(greenhouse_adapter) -> None:
-    slugs = asyncio.run(greenhouse_adapter.discover_from_sitemap())
+def test_discover_from_sitemap_returns_slugs(greenhouse_adapter, aio) -> None:
+    slugs = aio.run_until_complete(greenhouse_adapter.discover_from_sitemap())
     assert slugs == ["example-startup", "testorg"]
 
 
-def test_list_jobs_from_json_feed(greenhouse_adapter) -> None:
-    jobs = asyncio.run(greenhouse_adapter.list_jobs("testorg"))
+def test_list_jobs_from_json_feed(greenhouse_adapter, aio) -> None:
+    jobs = aio.run_until_complete(greenhouse_adapter.list_jobs("testorg"))
     assert len(jobs) == 1
     job = jobs[0]
     assert job.job_id == "12345"
@@ -33,9 +33,10 @@ def test_run_discovery_inserts_jobs(
     sqlite_session,
     greenhouse_adapter,
     test_settings,
+    aio,
 ) -> None:
     test_settings.job_filter_config_path = _TEST_FILTER_CONFIG
-    summary = asyncio.run(run_discovery(sqlite_session, [greenhouse_adapter], test_settings))
+    summary = aio.run_until_complete(run_discovery(sqlite_session, [greenhouse_adapter], test_settings))
 
     assert summary.orgs_crawled == 2
     assert summary.jobs_seen == 2
@@ -64,7 +65,7 @@ def test_run_discovery_inserts_jobs(
         assert trust_event.verdict is TrustVerdict.AUTO_SAFE
 
     # Second run should deduplicate and insert nothing.
-    summary_repeat = asyncio.run(run_discovery(sqlite_session, [greenhouse_adapter], test_settings))
+    summary_repeat = aio.run_until_complete(run_discovery(sqlite_session, [greenhouse_adapter], test_settings))
     assert summary_repeat.jobs_inserted == 0
 
 
@@ -73,12 +74,55 @@ def test_run_discovery_with_github_adapters(
     greenhouse_adapter,
     github_adapters,
     test_settings,
+    aio,
 ) -> None:
     test_settings.job_filter_config_path = _TEST_FILTER_CONFIG
     adapters = [greenhouse_adapter] + github_adapters
-    summary = asyncio.run(run_discovery(sqlite_session, adapters, test_settings))
+    summary = aio.run_until_complete(run_discovery(sqlite_session, adapters, test_settings))
 
     assert summary.orgs_crawled == 4
     assert summary.jobs_seen == 4
     assert summary.jobs_inserted == 4
     assert summary.domains_scored >= 2
+
+
+class _FailingDetailAdapter:
+    """Lists two jobs for one org and fails fetching the second's detail."""
+
+    source_name = "failing"
+    job_source_type = JobSourceType.COMPANY
+    submission_mode = SubmissionMode.DEEPLINK
+    uses_frontier = False
+
+    async def discover(self) -> list[str]:
+        return ["acme"]
+
+    async def list_jobs(self, org_slug: str) -> list[JobRef]:
+        return [
+            JobRef("failing", org_slug, job_id, "Software Engineer", "Remote", f"https://acme.example/jobs/{job_id}")
+            for job_id in ("1", "2")
+        ]
+
+    async def fetch_job_detail(self, job_ref: JobRef) -> JobDetail:
+        if job_ref.job_id == "2":
+            raise DiscoveryError("detail fetch failed")
+        return JobDetail(job_ref=job_ref, html="<p>Build services.</p>", company_name="Acme")
+
+    def canonical_id(self, job_ref: JobRef) -> str:
+        return f"FAIL:{job_ref.job_id}"
+
+    async def aclose(self) -> None:
+        return None
+
+
+def test_run_discovery_keeps_jobs_found_before_an_adapter_error(
+    sqlite_session,
+    test_settings,
+    aio,
+) -> None:
+    test_settings.job_filter_config_path = _TEST_FILTER_CONFIG
+    summary = aio.run_until_complete(run_discovery(sqlite_session, [_FailingDetailAdapter()], test_settings))
+    assert summary.jobs_inserted == 0
+
+    canonical_ids = list(sqlite_session.execute(select(models.Job.job_id_canonical)).scalars())
+    assert canonical_ids == ["FAIL:1"]
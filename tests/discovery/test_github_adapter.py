@@ -1,19 +1,16 @@
 from __future__ import annotations
 
-import asyncio
-
 import pytest
 
 from agentic_jobs.services.discovery.github_adapter import GithubPositionsAdapter
 
 
-def _build_adapter(test_settings, transport, *, source_name: str, slug: str, urls: list[str]):
-    import httpx
+def _build_adapter(test_settings, client, *, source_name: str, slug: str, urls: list[str]):
     from agentic_jobs.services.discovery.rate_limiter import AsyncRateLimiter
 
-    client = httpx.AsyncClient(transport=transport)
+    # The adapter borrows the shared client, so there is nothing to close per test.
     limiter = AsyncRateLimiter(500, 60.0)
-    adapter = GithubPositionsAdapter(
+    return GithubPositionsAdapter(
         test_settings,
         source_name=source_name,
         slug=slug,
@@ -21,7 +18,6 @@ def _build_adapter(test_settings, transport, *, source_name: str, slug: str, url
         client=client,
         rate_limiter=limiter,
     )
-    return adapter, client
 
 
 @pytest.mark.parametrize(
@@ -45,14 +41,10 @@ def _build_adapter(test_settings, transport, *, source_name: str, slug: str, url
         ),
     ],
 )
-def test_github_adapter_list_jobs(test_settings, github_transport_factory, source_name, slug, urls) -> None:
-    transport = github_transport_factory()
-    adapter, client = _build_adapter(test_settings, transport, source_name=source_name, slug=slug, urls=urls)
-    try:
-        jobs = asyncio.run(adapter.list_jobs(slug))
-    finally:
-        asyncio.run(adapter.aclose())
-        asyncio.run(client.aclose())
+@pytest.mark.asyncio
+async def test_github_adapter_list_jobs(test_settings, github_client, source_name, slug, urls) -> None:
+    adapter = _build_adapter(test_settings, github_client, source_name=source_name, slug=slug, urls=urls)
+    jobs = await adapter.list_jobs(slug)
 
     assert jobs
     job = jobs[0]
@@ -61,7 +53,8 @@ def test_github_adapter_list_jobs(test_settings, github_transport_factory, sourc
     assert job.detail_url.startswith("https://")
 
 
-def test_github_adapter_infers_company_from_url(test_settings, github_transport_factory) -> None:
+@pytest.mark.asyncio
+async def test_github_adapter_infers_company_from_url(test_settings, github_client, github_overrides) -> None:
     import httpx
 
     overrides = {
@@ -76,29 +69,25 @@ def test_github_adapter_infers_company_from_url(test_settings, github_transport_
             ],
         )
     }
-    transport = github_transport_factory(overrides=overrides)
-    adapter, client = _build_adapter(
+    github_overrides.update(overrides)
+    adapter = _build_adapter(
         test_settings,
-        transport,
+        github_client,
         source_name="simplify",
         slug="simplify",
         urls=["https://raw.githubusercontent.com/SimplifyJobs/New-Grad-Positions/dev/data/positions.json"],
     )
-    try:
-        jobs = asyncio.run(adapter.list_jobs("simplify"))
-    finally:
-        asyncio.run(adapter.aclose())
-        asyncio.run(client.aclose())
+    jobs = await adapter.list_jobs("simplify")
 
     assert jobs
     assert jobs[0].metadata["company"] == "Shieldai"
 
 
-def test_github_adapter_fetch_detail(test_settings, github_transport_factory) -> None:
-    transport = github_transport_factory()
-    adapter, client = _build_adapter(
+@pytest.mark.asyncio
+async def test_github_adapter_fetch_detail(test_settings, github_client) -> None:
+    adapter = _build_adapter(
         test_settings,
-        transport,
+        github_client,
         source_name="simplify",
         slug="simplify",
         urls=[
@@ -106,28 +95,25 @@ def test_github_adapter_fetch_detail(test_settings, github_transport_factory) ->
             "https://raw.githubusercontent.com/SimplifyJobs/New-Grad-Positions/dev/src/data/positions.json",
         ],
     )
-    try:
-        jobs = asyncio.run(adapter.list_jobs("simplify"))
-        detail = asyncio.run(adapter.fetch_job_detail(jobs[0]))
-    finally:
-        asyncio.run(adapter.aclose())
-        asyncio.run(client.aclose())
+    jobs = await adapter.list_jobs("simplify")
+    detail = await adapter.fetch_job_detail(jobs[0])
 
     assert detail.company_name
     assert "<h1>" in detail.html
     assert "TestCorp platform team" in detail.html
 
 
-def test_github_adapter_fallback_url(test_settings, github_transport_factory) -> None:
+@pytest.mark.asyncio
+async def test_github_adapter_fallback_url(test_settings, github_client, github_overrides) -> None:
     import httpx
 
     overrides = {
         ("GET", "/SimplifyJobs/New-Grad-Positions/dev/.github/scripts/listings.json"): httpx.Response(404)
     }
-    transport = github_transport_factory(overrides=overrides)
-    adapter, client = _build_adapter(
+    github_overrides.update(overrides)
+    adapter = _build_adapter(
         test_settings,
-        transport,
+        github_client,
         source_name="simplify",
         slug="simplify",
         urls=[
@@ -135,16 +121,13 @@ def test_github_adapter_fallback_url(test_settings, github_transport_factory) ->
             "https://raw.githubusercontent.com/SimplifyJobs/New-Grad-Positions/dev/src/data/positions.json",
         ],
     )
-    try:
-        jobs = asyncio.run(adapter.list_jobs("simplify"))
-    finally:
-        asyncio.run(adapter.aclose())
-        asyncio.run(client.aclose())
+    jobs = await adapter.list_jobs("simplify")
 
     assert jobs  # fallback URL succeeded
 
 
-def test_github_adapter_filters_old_jobs(test_settings, github_transport_factory) -> None:
+@pytest.mark.asyncio
+async def test_github_adapter_filters_old_jobs(test_settings, github_client, github_overrides) -> None:
     import httpx
 
     overrides = {
@@ -160,24 +143,21 @@ def test_github_adapter_filters_old_jobs(test_settings, github_transport_factory
             ],
         )
     }
-    transport = github_transport_factory(overrides=overrides)
-    adapter, client = _build_adapter(
+    github_overrides.update(overrides)
+    adapter = _build_adapter(
         test_settings,
-        transport,
+        github_client,
         source_name="simplify",
         slug="simplify",
         urls=["https://raw.githubusercontent.com/SimplifyJobs/New-Grad-Positions/dev/data/positions.json"],
     )
-    try:
-        jobs = asyncio.run(adapter.list_jobs("simplify"))
-    finally:
-        asyncio.run(adapter.aclose())
-        asyncio.run(client.aclose())
+    jobs = await adapter.list_jobs("simplify")
 
     assert jobs == []
 
 
-def test_github_adapter_supports_listings_container(test_settings, github_transport_factory) -> None:
+@pytest.mark.asyncio
+async def test_github_adapter_supports_listings_container(test_settings, github_client, github_overrides) -> None:
     import httpx
 
     overrides = {
@@ -196,10 +176,10 @@ def test_github_adapter_supports_listings_container(test_settings, github_transp
         )
     }
 
-    transport = github_transport_factory(overrides=overrides)
-    adapter, client = _build_adapter(
+    github_overrides.update(overrides)
+    adapter = _build_adapter(
         test_settings,
-        transport,
+        github_client,
         source_name="simplify",
         slug="simplify",
         urls=[
@@ -208,10 +188,6 @@ def test_github_adapter_supports_listings_container(test_settings, github_transp
         ],
     )
 
-    try:
-        jobs = asyncio.run(adapter.list_jobs("simplify"))
-    finally:
-        asyncio.run(adapter.aclose())
-        asyncio.run(client.aclose())
+    jobs = await adapter.list_jobs("simplify")
 
     assert len(jobs) == 1
@@ -1,4 +1,6 @@
-from agentic_jobs.services.llm.style_kit import load_cover_letter_kit
+import os
+
+from agentic_jobs.services.llm.style_kit import KIT_PATH, load_cover_letter_kit
 
 
 def test_cover_letter_kit_loads() -> None:
@@ -7,3 +9,18 @@ def test_cover_letter_kit_loads() -> None:
     assert len(kit.projects) >= 1
     # The kit must carry the no-em-dash rule among its don'ts (wording may vary).
     assert any("em dash" in dont.lower() for dont in kit.donts)
+
+
+def test_cover_letter_kit_reloads_after_edit(tmp_path) -> None:
+    kit_path = tmp_path / "cover_letter_kit.yaml"
+    original = KIT_PATH.read_text(encoding="utf-8")
+    kit_path.write_text(original, encoding="utf-8")
+    first = load_cover_letter_kit(kit_path)
+
+    kit_path.write_text(original.replace("\ndos:", "\ndos:\n  - Edited rule.", 1), encoding="utf-8")
+    stat = kit_path.stat()
+    os.utime(kit_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = load_cover_letter_kit(kit_path)
+    assert "Edited rule." not in first.dos
+    assert reloaded.dos[0] == "Edited rule."
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
@@ -57,7 +56,8 @@ def test_next_run_time_rolls_to_next_day(monkeypatch):
     assert target.hour == 6
 
 
-def test_post_digest_posts_empty_message_when_no_jobs(monkeypatch, sqlite_session):
+@pytest.mark.asyncio
+async def test_post_digest_posts_empty_message_when_no_jobs(monkeypatch, sqlite_session):
     recorded_messages: list[dict] = []
 
     class DummySlackClient:
@@ -74,13 +74,9 @@ def test_post_digest_posts_empty_message_when_no_jobs(monkeypatch, sqlite_sessio
             recorded_messages.append({"channel": channel, "text": text, "blocks": blocks})
             return SimpleNamespace(data={"channel": channel, "ts": "1700000000.000000"})
 
-    async def _run() -> None:
-        dummy_settings = _make_settings()
-        monkeypatch.setattr(cron, "settings", dummy_settings)
-        monkeypatch.setattr(cron, "SlackClient", DummySlackClient)
-        await cron._post_digest_and_reviews(sqlite_session, datetime.now(tz=timezone.utc))
-
-    asyncio.run(_run())
+    monkeypatch.setattr(cron, "settings", _make_settings())
+    monkeypatch.setattr(cron, "SlackClient", DummySlackClient)
+    await cron._post_digest_and_reviews(sqlite_session, datetime.now(tz=timezone.utc))
 
     assert recorded_messages
     message = recorded_messages[0]
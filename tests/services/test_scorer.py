@@ -0,0 +1,91 @@
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from agentic_jobs.config import settings
+from agentic_jobs.services.discovery.config import get_job_filter_config
+from agentic_jobs.services.ranking import scorer
+
+_TEST_FILTER_CONFIG = str(Path(__file__).resolve().parent.parent / "fixtures" / "job_filters_test.yaml")
+
+
+def _job(number: int = 1, **overrides) -> SimpleNamespace:
+    fields = {
+        "id": UUID(int=number),
+        "hash": f"hash-{number}",
+        "title": "Software Engineer",
+        "jd_text": "New grad role building services.",
+        "location": "Remote",
+        **overrides,
+    }
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture
+def score_calls(monkeypatch) -> list:
+    """Fresh memo per test; returns the jobs that were actually scored."""
+    monkeypatch.setattr(settings, "job_filter_config_path", _TEST_FILTER_CONFIG)
+    monkeypatch.setattr(scorer, "_SCORE_MEMO", {})
+    calls: list = []
+    real_score = scorer._score
+
+    def _spy(job, filter_config):
+        calls.append(job)
+        return real_score(job, filter_config)
+
+    monkeypatch.setattr(scorer, "_score", _spy)
+    return calls
+
+
+def test_repeat_call_returns_memoized_result(score_calls) -> None:
+    job = _job()
+
+    first = scorer.score_job(job)
+    second = scorer.score_job(job)
+
+    assert second is first
+    assert score_calls == [job]
+
+
+def test_changed_hash_is_rescored(score_calls) -> None:
+    scorer.score_job(_job())
+    changed = _job(hash="hash-edited", title="Accountant")
+
+    scorer.score_job(changed)
+
+    assert score_calls[-1] is changed
+    assert len(score_calls) == 2
+
+
+def test_explicit_filter_config_bypasses_memo(score_calls) -> None:
+    job = _job()
+    config = get_job_filter_config(_TEST_FILTER_CONFIG)
+
+    scorer.score_job(job, config)
+    scorer.score_job(job, config)
+
+    assert len(score_calls) == 2
+    assert scorer._SCORE_MEMO == {}
+
+
+def test_unsaved_job_is_not_memoized(score_calls) -> None:
+    job = _job(id=None)
+
+    scorer.score_job(job)
+    scorer.score_job(job)
+
+    assert len(score_calls) == 2
+    assert scorer._SCORE_MEMO == {}
+
+
+def test_memo_evicts_oldest_entry_at_capacity(score_calls, monkeypatch) -> None:
+    monkeypatch.setattr(scorer, "_SCORE_MEMO_MAX", 2)
+    oldest, middle, newest = _job(1), _job(2), _job(3)
+
+    scorer.score_jobs([oldest, middle, newest])
+
+    assert [key[0] for key in scorer._SCORE_MEMO] == [middle.id, newest.id]
+    scorer.score_job(oldest)
+    assert score_calls.count(oldest) == 2
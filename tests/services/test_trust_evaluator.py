@@ -0,0 +1,27 @@
+import pytest
+
+from agentic_jobs.core.enums import TrustVerdict
+from agentic_jobs.services.trust.evaluator import evaluate
+
+
+@pytest.mark.asyncio
+async def test_whitelisted_host_is_auto_safe():
+    result = await evaluate("https://boards.greenhouse.io/acme/jobs/1", "")
+
+    assert result.verdict is TrustVerdict.AUTO_SAFE
+    assert {"signal": "ats_type", "value": "greenhouse"} in result.signals
+
+
+@pytest.mark.asyncio
+async def test_mutating_signals_does_not_leak_into_later_results():
+    first = await evaluate("https://unknown.example.org/jobs/1", "unknown.example.org")
+    for signal in first.signals:
+        signal["value"] = "tampered"
+
+    second = await evaluate("https://unknown.example.org/jobs/2", "unknown.example.org")
+
+    assert second.verdict is TrustVerdict.NEEDS_HUMAN_APPROVAL
+    assert second.signals == [
+        {"signal": "host", "value": "unknown.example.org"},
+        {"signal": "whitelist", "value": "none"},
+    ]
@@ -1,4 +1,3 @@
-import asyncio
 from datetime import datetime, timezone
 
 import pytest
@@ -35,7 +34,8 @@ def pending_domain(sqlite_session):
     return domain
 
 
-def test_handle_needs_review_approve_adds_whitelist(sqlite_session, pending_domain):
+@pytest.mark.asyncio
+async def test_handle_needs_review_approve_adds_whitelist(sqlite_session, pending_domain):
     payload = {
         "type": "block_actions",
         "user": {"id": "U123"},
@@ -50,7 +50,7 @@ def test_handle_needs_review_approve_adds_whitelist(sqlite_session, pending_doma
     }
 
     client = DummySlackClient()
-    response = asyncio.run(handle_needs_review_approve(payload, sqlite_session, client))
+    response = await handle_needs_review_approve(payload, sqlite_session, client)
 
     whitelist = sqlite_session.get(models.Whitelist, pending_domain.domain_root)
     updated_domain = sqlite_session.execute(
@@ -63,7 +63,8 @@ def test_handle_needs_review_approve_adds_whitelist(sqlite_session, pending_doma
     assert client.updated_messages
 
 
-def test_handle_needs_review_reject_sets_mute(sqlite_session, pending_domain):
+@pytest.mark.asyncio
+async def test_handle_needs_review_reject_sets_mute(sqlite_session, pending_domain):
     payload = {
         "type": "block_actions",
         "user": {"id": "U456"},
@@ -78,7 +79,7 @@ def test_handle_needs_review_reject_sets_mute(sqlite_session, pending_domain):
     }
 
     client = DummySlackClient()
-    response = asyncio.run(handle_needs_review_reject(payload, sqlite_session, client, mute_days=3))
+    response = await handle_needs_review_reject(payload, sqlite_session, client, mute_days=3)
 
     updated_domain = sqlite_session.execute(
         select(models.DomainReview).where(models.DomainReview.domain_root == pending_domain.domain_root)
@@ -1,9 +1,9 @@
-import asyncio
 import json
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from uuid import uuid4
 
+import pytest
 from sqlalchemy import select
 
 from agentic_jobs.core.enums import JobSourceType, SubmissionMode
@@ -33,7 +33,8 @@ class DummySlackClient:
         return SlackResponse(ok=True, data={"ts": "1700000000.222222", "channel": channel})
 
 
-def test_handle_save_to_tracker_creates_application(sqlite_session, monkeypatch):
+@pytest.mark.asyncio
+async def test_handle_save_to_tracker_creates_application(sqlite_session, monkeypatch):
     monkeypatch.setattr(
         "agentic_jobs.services.slack.actions.settings",
         SimpleNamespace(slack_jobs_drafts_channel="CDRAFT", slack_jobs_tracker_channel="CTRACK"),
@@ -71,7 +72,7 @@ def test_handle_save_to_tracker_creates_application(sqlite_session, monkeypatch)
     }
 
     client = DummySlackClient()
-    response = asyncio.run(handle_save_to_tracker(payload, sqlite_session, client))
+    response = await handle_save_to_tracker(payload, sqlite_session, client)
 
     application = sqlite_session.execute(select(models.Application)).scalar_one()
 
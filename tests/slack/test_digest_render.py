@@ -1,11 +1,13 @@
-import uuid
+from uuid import UUID
 
 from agentic_jobs.services.slack.digest import DigestRow, build_digest_blocks
 
+_JOB_ID = UUID(int=1)
+
 
 def test_build_digest_blocks_includes_actions() -> None:
     row = DigestRow(
-        job_id=uuid.uuid4(),
+        job_id=_JOB_ID,
         canonical_id="GH:12345",
         title="Backend Software Engineer",
         company="Acme Corp",
@@ -0,0 +1,136 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from agentic_jobs.core.enums import (
+    ApplicationStage,
+    AutofillMode,
+    AutofillTaskStatus,
+)
+from agentic_jobs.db import models
+from agentic_jobs.services.applications.stage import apply_stage
+from agentic_jobs.services.slack.client import SlackResponse
+from agentic_jobs.services.slack.tracker import MasterTracker
+
+
+class DummySlackClient:
+    def __init__(self) -> None:
+        self.message_calls: list[dict] = []
+        self.update_calls: list[dict] = []
+
+    async def post_message(self, channel: str, *, blocks=None, text=None):
+        self.message_calls.append({"channel": channel, "blocks": blocks, "text": text})
+        return SlackResponse(ok=True, data={"ts": "1700000000.111111", "channel": channel})
+
+    async def update_message(self, channel: str, ts: str, *, blocks=None, text=None):
+        self.update_calls.append({"channel": channel, "ts": ts, "blocks": blocks, "text": text})
+        return SlackResponse(ok=True, data={"ts": ts, "channel": channel})
+
+    async def delete_message(self, channel: str, ts: str):
+        return SlackResponse(ok=True, data={})
+
+
+@pytest.fixture
+def tracker_settings(monkeypatch):
+    config = SimpleNamespace(
+        slack_jobs_tracker_channel="CTRACK",
+        tracker_rows_per_page=10,
+        tracker_max_pages=1,
+        autofill_enabled=True,
+    )
+    monkeypatch.setattr("agentic_jobs.services.slack.tracker.settings", config)
+    return config
+
+
+def _add_application(session, job, stage=ApplicationStage.INTERESTED, **fields) -> models.Application:
+    application = models.Application(
+        human_id=f"APP-2025-{job.job_id_canonical[-3:]}",
+        job_id=job.id,
+        score=0.5,
+        canonical_job_id=job.job_id_canonical,
+        submission_mode=job.submission_mode,
+        **fields,
+    )
+    apply_stage(application, stage)
+    session.add(application)
+    session.commit()
+    return application
+
+
+async def _tracker_with_one_page(sqlite_session, job_factory):
+    application = _add_application(sqlite_session, job_factory(job_id_canonical="SRC:001"))
+    client = DummySlackClient()
+    tracker = MasterTracker(sqlite_session, client)
+    await tracker.refresh()
+    assert len(client.message_calls) == 1
+    return tracker, client, application
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_update_when_page_unchanged(sqlite_session, job_factory, tracker_settings):
+    tracker, client, _ = await _tracker_with_one_page(sqlite_session, job_factory)
+
+    await tracker.refresh()
+
+    assert client.update_calls == []
+    assert len(client.message_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_updates_when_row_changes(sqlite_session, job_factory, tracker_settings):
+    tracker, client, application = await _tracker_with_one_page(sqlite_session, job_factory)
+
+    application.score = 0.9
+    sqlite_session.commit()
+    await tracker.refresh()
+
+    assert len(client.update_calls) == 1
+    assert "`0.90`" in client.update_calls[0]["blocks"][-1]["text"]["text"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_updates_when_stage_count_changes(sqlite_session, job_factory, tracker_settings):
+    # One row per page: the older application only shows up in the stage counts.
+    tracker_settings.tracker_rows_per_page = 1
+    older = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    hidden = _add_application(
+        sqlite_session, job_factory(job_id_canonical="SRC:002"), updated_at=older
+    )
+    tracker, client, _ = await _tracker_with_one_page(sqlite_session, job_factory)
+
+    await tracker.refresh()
+    assert client.update_calls == []
+
+    apply_stage(hidden, ApplicationStage.SUBMITTED)
+    hidden.updated_at = older
+    sqlite_session.commit()
+    await tracker.refresh()
+
+    assert len(client.update_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_updates_when_autofill_queue_changes(sqlite_session, job_factory, tracker_settings):
+    tracker, client, application = await _tracker_with_one_page(sqlite_session, job_factory)
+
+    sqlite_session.add(
+        models.AutofillTask(
+            application_id=application.id,
+            status=AutofillTaskStatus.QUEUED,
+            mode=AutofillMode.AUTOFILL,
+            domain_root="example.com",
+            payload_path="/tmp/payload.json",
+        )
+    )
+    sqlite_session.commit()
+    await tracker.refresh()
+
+    assert len(client.update_calls) == 1
+    action_ids = [
+        element["action_id"]
+        for block in client.update_calls[0]["blocks"]
+        if block["type"] == "actions"
+        for element in block["elements"]
+    ]
+    assert action_ids == ["autofill_run_all"]
@@ -1,6 +1,5 @@
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 
-from agentic_jobs.core.enums import JobSourceType, SubmissionMode
 from agentic_jobs.db import models
 from agentic_jobs.services.slack.workflows import (
     collect_digest_rows,
@@ -8,32 +7,10 @@ from agentic_jobs.services.slack.workflows import (
     last_posted_job_scraped_at,
 )
 
+_NOW = datetime.now(timezone.utc)
 
-def _create_job(session, **overrides):
-    defaults = {
-        "title": "Software Engineer",
-        "company_name": "ExampleCo",
-        "location": "Remote",
-        "url": "https://example.com/jobs/123",
-        "source_type": JobSourceType.COMPANY,
-        "source_name": "Example Source",
-        "domain_root": "example.com",
-        "submission_mode": SubmissionMode.DEEPLINK,
-        "jd_text": "Build services.",
-        "requirements": [{"type": "bullet", "value": "Python"}],
-        "job_id_canonical": overrides.get("job_id_canonical", f"SRC:{datetime.utcnow().timestamp()}"),
-        "scraped_at": datetime.utcnow(),
-        "hash": overrides.get("hash", f"hash-{datetime.utcnow().timestamp()}"),
-    }
-    defaults.update(overrides)
-    job = models.Job(**defaults)
-    session.add(job)
-    session.commit()
-    session.refresh(job)
-    return job
-
-
-def _log_digest(session, job, digest_day):
+
+def _log_digest(session, job, digest_day, *, commit=True):
     log = models.DigestLog(
         job_id=job.id,
         digest_date=digest_day,
@@ -41,23 +18,25 @@ def _log_digest(session, job, digest_day):
         slack_message_ts="1700.0",
     )
     session.add(log)
-    session.commit()
+    if commit:
+        session.commit()
     return log
 
 
-def test_collect_digest_rows_uses_last_posted_cutoff(sqlite_session):
-    older = _create_job(
-        sqlite_session,
+def test_collect_digest_rows_uses_last_posted_cutoff(sqlite_session, job_factory):
+    older = job_factory(
         job_id_canonical="SRC:old",
-        scraped_at=datetime.utcnow() - timedelta(days=5),
+        commit=False,
+        scraped_at=_NOW - timedelta(days=5),
     )
-    newer = _create_job(
-        sqlite_session,
+    newer = job_factory(
         job_id_canonical="SRC:new",
-        scraped_at=datetime.utcnow() - timedelta(days=1),
+        commit=False,
+        scraped_at=_NOW - timedelta(days=1),
     )
 
-    _log_digest(sqlite_session, older, digest_day=date(2024, 1, 1))
+    _log_digest(sqlite_session, older, digest_day=date(2024, 1, 1), commit=False)
+    sqlite_session.commit()
 
     rows = collect_digest_rows(
         sqlite_session,
@@ -70,19 +49,20 @@ def test_collect_digest_rows_uses_last_posted_cutoff(sqlite_session):
     assert rows[0].job_id == newer.id
 
 
-def test_last_posted_job_scraped_at_returns_latest_logged(sqlite_session):
-    older = _create_job(
-        sqlite_session,
+def test_last_posted_job_scraped_at_returns_latest_logged(sqlite_session, job_factory):
+    older = job_factory(
         job_id_canonical="SRC:old2",
-        scraped_at=datetime.utcnow() - timedelta(days=10),
+        commit=False,
+        scraped_at=_NOW - timedelta(days=10),
     )
-    newer = _create_job(
-        sqlite_session,
+    newer = job_factory(
         job_id_canonical="SRC:new2",
-        scraped_at=datetime.utcnow() - timedelta(days=2),
+        commit=False,
+        scraped_at=_NOW - timedelta(days=2),
     )
 
-    _log_digest(sqlite_session, older, digest_day=date(2024, 1, 2))
+    _log_digest(sqlite_session, older, digest_day=date(2024, 1, 2), commit=False)
+    sqlite_session.commit()
 
     assert last_posted_job_scraped_at(sqlite_session) == older.scraped_at
 
@@ -91,9 +71,8 @@ def test_last_posted_job_scraped_at_returns_latest_logged(sqlite_session):
     assert last_posted_job_scraped_at(sqlite_session) == newer.scraped_at
 
 
-def test_collect_needs_review_auto_whitelist_skips_known_domain(sqlite_session):
-    job = _create_job(
-        sqlite_session,
+def test_collect_needs_review_auto_whitelist_skips_known_domain(sqlite_session, job_factory):
+    job = job_factory(
         domain_root="jobs.ashbyhq.com",
         job_id_canonical="SRC:auto_whitelist",
     )
@@ -1,3 +1,5 @@
+import pytest
+
 from agentic_jobs.services.sources.normalize import (
     compute_hash,
     extract_requirements,
@@ -5,18 +7,24 @@ from agentic_jobs.services.sources.normalize import (
 )
 
 
-def test_html_to_text_strips_markup(load_fixture) -> None:
-    html = load_fixture("gh_job_detail_engineer.html")
-    text = html_to_text(html)
+@pytest.fixture(scope="module")
+def gh_engineer_html(load_fixture) -> str:
+    return load_fixture("gh_job_detail_engineer.html")
+
+
+@pytest.fixture(scope="module")
+def gh_engineer_text(gh_engineer_html: str) -> str:
+    return html_to_text(gh_engineer_html)
+
 
-    assert "Software Engineer" in text
-    assert "<" not in text
-    assert "Build reliable backend services." in text
+def test_html_to_text_strips_markup(gh_engineer_text: str) -> None:
+    assert "Software Engineer" in gh_engineer_text
+    assert "<" not in gh_engineer_text
+    assert "Build reliable backend services." in gh_engineer_text
 
 
-def test_extract_requirements_returns_bullets(load_fixture) -> None:
-    html = load_fixture("gh_job_detail_engineer.html")
-    requirements = extract_requirements(html)
+def test_extract_requirements_returns_bullets(gh_engineer_html: str) -> None:
+    requirements = extract_requirements(gh_engineer_html)
 
     assert any("Python" in item["value"] for item in requirements)
     assert all(item["type"] in {"bullet", "text"} for item in requirements)
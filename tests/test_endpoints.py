@@ -1,34 +1,58 @@
-from uuid import uuid4
+import asyncio
+from dataclasses import replace
+from typing import TYPE_CHECKING
+from uuid import UUID
 
-from fastapi.testclient import TestClient
+import pytest
+from pydantic import TypeAdapter
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from agentic_jobs.main import app
-from agentic_jobs.config import settings
-from agentic_jobs.core.enums import TrustVerdict
-from agentic_jobs.db.session import Base, get_session
-from agentic_jobs.services.discovery.base import DiscoverySummary
-from agentic_jobs.services.drafts.generator import DraftResult
-from agentic_jobs.services.trust.evaluator import TrustResult
-from agentic_jobs.api.v1.drafts import get_draft_generator
+if TYPE_CHECKING:
+    from agentic_jobs.services.drafts.generator import DraftResult
 
+# The API modules pull in the whole router tree, so they are imported inside
+# the fixtures and tests that need them rather than at collection time.
 
-settings.slack_bot_token = None
-settings.slack_app_level_token = None
-settings.environment = "test"
+_ID_A = UUID(int=1)
+_ID_B = UUID(int=2)
 
-client = TestClient(app)
+_JSON_HEADERS = {"content-type": "application/json"}
 
 
-def test_trust_evaluate_validates_url() -> None:
-    # No body, and a url without a scheme, both fail request validation.
-    assert client.post("/api/v1/trust/evaluate").status_code == 422
-    assert client.post("/api/v1/trust/evaluate", json={"url": "example.com"}).status_code == 422
+@pytest.fixture(scope="module")
+def draft_body():
+    from agentic_jobs.api.v1.drafts import DraftRequest
 
+    adapter = TypeAdapter(DraftRequest)
+
+    def _encode(application_id, notes: list[str]) -> bytes:
+        # Serialize straight to JSON bytes; the server does the validation.
+        return adapter.dump_json(
+            DraftRequest.model_construct(application_id=application_id, notes=notes, author="tester")
+        )
+
+    return _encode
+
+
+@pytest.mark.parametrize(
+    ("path", "body"),
+    [
+        # No body, and a url without a scheme, both fail request validation.
+        ("/api/v1/trust/evaluate", None),
+        ("/api/v1/trust/evaluate", {"url": "example.com"}),
+        ("/api/v1/applications/create", None),
+    ],
+)
+def test_post_rejects_invalid_body(client, path, body) -> None:
+    assert client.post(path, json=body).status_code == 422
+
+
+def test_trust_evaluate_returns_result(client, monkeypatch, assert_ok) -> None:
+    from agentic_jobs.core.enums import TrustVerdict
+    from agentic_jobs.services.trust.evaluator import TrustResult
 
-def test_trust_evaluate_returns_result(monkeypatch) -> None:
     async def fake_evaluate(url: str, domain_root: str) -> TrustResult:
         return TrustResult(
             score=90,
@@ -41,19 +65,16 @@ def test_trust_evaluate_returns_result(monkeypatch) -> None:
         "/api/v1/trust/evaluate",
         json={"url": "https://example.com/jobs/1"},
     )
-    assert response.status_code == 200
-    data = response.json()
+    data = assert_ok(response)
     assert data["domain_root"] == "example.com"
     assert data["score"] == 90
     assert data["verdict"] == "auto-safe"
     assert data["signals"] == [{"name": "tls", "detail": "valid"}]
 
 
-def test_applications_create_requires_body() -> None:
-    assert client.post("/api/v1/applications/create").status_code == 422
-
+def test_applications_create_unknown_job_returns_404(client, override_dep) -> None:
+    from agentic_jobs.db.session import Base, get_session
 
-def test_applications_create_unknown_job_returns_404() -> None:
     engine = create_engine(
         "sqlite+pysqlite:///:memory:",
         future=True,
@@ -70,95 +91,124 @@ def test_applications_create_unknown_job_returns_404() -> None:
         finally:
             db.close()
 
-    app.dependency_overrides[get_session] = override_get_session
+    override_dep(get_session, override_get_session)
     try:
         response = client.post(
             "/api/v1/applications/create",
-            json={"job_id": str(uuid4())},
+            json={"job_id": str(_ID_A)},
         )
         assert response.status_code == 404
     finally:
-        app.dependency_overrides.clear()
         Base.metadata.drop_all(engine)
         engine.dispose()
 
 
-def test_discover_run_endpoint(monkeypatch) -> None:
-    class DummyAdapter:
-        job_source_type = None
-        submission_mode = None
+def _resolved(value) -> asyncio.Future:
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
+
+
+class DummyAdapter:
+    job_source_type = None
+    submission_mode = None
+
+    # Already-resolved futures are awaitable, so no coroutine per enter/exit.
+    def __aenter__(self) -> asyncio.Future:
+        return _resolved(self)
+
+    def __aexit__(self, exc_type, exc, tb) -> asyncio.Future:
+        return _resolved(False)
+
+    async def aclose(self):
+        return None
+
+
+_DUMMY = DummyAdapter()
+
 
-        async def __aenter__(self):
-            return self
+@pytest.fixture(scope="module")
+def discovery_summary():
+    from agentic_jobs.services.discovery.base import DiscoverySummary
 
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
+    # Only read by the response serializer, so one instance serves every run.
+    return DiscoverySummary(orgs_crawled=3, jobs_seen=5, jobs_inserted=4, domains_scored=2)
 
-        async def aclose(self):
-            return None
+
+def test_discover_run_endpoint(client, monkeypatch, assert_ok, discovery_summary) -> None:
+    import agentic_jobs.api.v1.discover as discover_mod
 
     async def fake_run_discovery(session, adapters, settings):
-        return DiscoverySummary(orgs_crawled=3, jobs_seen=5, jobs_inserted=4, domains_scored=2)
-
-    monkeypatch.setattr("agentic_jobs.api.v1.discover.GreenhouseAdapter", lambda settings: DummyAdapter())
-    monkeypatch.setattr("agentic_jobs.api.v1.discover.GithubPositionsAdapter", lambda *args, **kwargs: DummyAdapter())
-    monkeypatch.setattr("agentic_jobs.api.v1.discover.run_discovery", fake_run_discovery)
-
-    response = client.post("/api/v1/discover/run")
-    assert response.status_code == 200
-    assert response.json() == {
-        "orgs_crawled": 3,
-        "jobs_seen": 5,
-        "jobs_inserted": 4,
-        "domains_scored": 2,
-    }
-
-
-def test_drafts_create_stub() -> None:
-    fake_id = uuid4()
-
-    class DummyGenerator:
-        async def generate(self, *args, **kwargs):
-            return DraftResult(
-                application_id=fake_id,
-                human_id="APP-2025-001",
-                version="CL v1",
-                cover_letter_md="Dear Hiring Manager,\n\nBody\n\nSincerely,\nApoorva",
-                artifact_uri="file:///tmp/cl.md",
-                payload={},
-            )
-
-    app.dependency_overrides[get_draft_generator] = lambda: DummyGenerator()
+        return discovery_summary
+
+    monkeypatch.setattr(discover_mod, "GreenhouseAdapter", lambda settings: _DUMMY)
+    monkeypatch.setattr(discover_mod, "GithubPositionsAdapter", lambda *args, **kwargs: _DUMMY)
+    monkeypatch.setattr(discover_mod, "run_discovery", fake_run_discovery)
+
+    assert_ok(
+        client.post("/api/v1/discover/run"),
+        {
+            "orgs_crawled": 3,
+            "jobs_seen": 5,
+            "jobs_inserted": 4,
+            "domains_scored": 2,
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def base_draft() -> "DraftResult":
+    from agentic_jobs.services.drafts.generator import DraftResult
+
+    return DraftResult(
+        application_id=_ID_B,
+        human_id="APP-2025-001",
+        version="CL v1",
+        cover_letter_md="Dear Hiring Manager,\n\nBody\n\nSincerely,\nApoorva",
+        artifact_uri="file:///tmp/cl.md",
+        payload={},
+    )
+
+
+class DummyGenerator:
+    """Draft generator stand-in that returns a fixed result."""
+
+    def __init__(self, result: "DraftResult") -> None:
+        self.result = result
+
+    async def generate(self, *args, **kwargs) -> "DraftResult":
+        return self.result
+
+
+def test_drafts_create_stub(client, override_dep, assert_ok, draft_body, base_draft) -> None:
+    from agentic_jobs.api.v1.drafts import get_draft_generator
+
+    fake_id = base_draft.application_id
+    generator = DummyGenerator(base_draft)
+
+    override_dep(get_draft_generator, lambda: generator)
     response = client.post(
         "/api/v1/drafts/create",
-        json={"application_id": str(fake_id), "notes": [], "author": "tester"},
+        content=draft_body(fake_id, []),
+        headers=_JSON_HEADERS,
     )
-    assert response.status_code == 200
-    data = response.json()
+    data = assert_ok(response)
     assert data["application_id"] == str(fake_id)
     assert data["human_id"] == "APP-2025-001"
-    app.dependency_overrides.clear()
 
 
-def test_drafts_feedback_stub() -> None:
-    fake_id = uuid4()
+def test_drafts_feedback_stub(client, override_dep, assert_ok, draft_body, base_draft) -> None:
+    from agentic_jobs.api.v1.drafts import get_draft_generator
 
-    class DummyGenerator:
-        async def generate(self, *args, **kwargs):
-            return DraftResult(
-                application_id=fake_id,
-                human_id="APP-2025-001",
-                version="CL v2",
-                cover_letter_md="Update",
-                artifact_uri="file:///tmp/cl-v2.md",
-                payload={},
-            )
+    fake_id = base_draft.application_id
+    generator = DummyGenerator(
+        replace(base_draft, version="CL v2", cover_letter_md="Update", artifact_uri="file:///tmp/cl-v2.md")
+    )
 
-    app.dependency_overrides[get_draft_generator] = lambda: DummyGenerator()
+    override_dep(get_draft_generator, lambda: generator)
     response = client.post(
         "/api/v1/drafts/feedback",
-        json={"application_id": str(fake_id), "notes": ["More energy"], "author": "tester"},
+        content=draft_body(fake_id, ["More energy"]),
+        headers=_JSON_HEADERS,
     )
-    assert response.status_code == 200
-    assert response.json()["version"] == "CL v2"
-    app.dependency_overrides.clear()
+    assert assert_ok(response)["version"] == "CL v2"
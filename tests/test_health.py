@@ -1,12 +1,2 @@
-from fastapi.testclient import TestClient
-
-from agentic_jobs.main import app
-
-
-client = TestClient(app)
-
-
-def test_healthz_ok() -> None:
-    response = client.get("/healthz")
-    assert response.status_code == 200
-    assert response.json() == {"status": "ok"}
+def test_healthz_ok(client, assert_ok) -> None:
+    assert_ok(client.get("/healthz"), {"status": "ok"})
@@ -1,5 +1,7 @@
 from datetime import datetime, timezone
-from uuid import uuid4
+from uuid import UUID
+
+import pytest
 
 from agentic_jobs.core.enums import (
     ApplicationStatus,
@@ -23,13 +25,24 @@ from agentic_jobs.schemas import (
 )
 
 
-def _timestamp() -> datetime:
-    return datetime.now(timezone.utc)
+_TIMESTAMP = datetime(2025, 1, 1, tzinfo=timezone.utc)
+_ID_A = UUID(int=1)
+_ID_B = UUID(int=2)
+_ID_C = UUID(int=3)
+_ID_D = UUID(int=4)
+
+# Read-only profile inputs; pydantic copies the tuples into fresh lists.
+_SKILLS = ("Python", "SQL", "FastAPI")
+_TOOLS = ("Docker", "Git")
+_FRAMEWORKS = ("FastAPI", "SQLAlchemy")
+_PROJECTS = (
+    {"name": "RAG Eval", "one_liner": "Evaluated RAG pipelines", "metric": "20% faster"},
+)
 
 
-def test_job_model_validation() -> None:
+def test_job_model_validates_url_coercion() -> None:
     job = JobModel(
-        id=uuid4(),
+        id=_ID_A,
         title="Backend Software Engineer",
         company_name="Example Corp",
         location="New York, NY",
@@ -41,23 +54,24 @@ def test_job_model_validation() -> None:
         jd_text="Responsibilities include building APIs.",
         requirements=[{"type": "text", "value": "Experience with FastAPI"}],
         job_id_canonical="GH:12345",
-        scraped_at=_timestamp(),
+        scraped_at=_TIMESTAMP,
         hash="abc123hash",
     )
 
     assert job.job_id_canonical == "GH:12345"
+    assert job.url.host == "jobs.example.com"
 
 
 def test_job_source_model_validation() -> None:
     job_source = JobSourceModel(
-        id=uuid4(),
+        id=_ID_A,
         source_type=JobSourceType.GREENHOUSE,
         source_name="Greenhouse",
         source_url="https://boards.greenhouse.io/example/jobs/12345",
         company_name="Example Corp",
         domain_root="greenhouse.io",
         raw_payload={"id": 12345, "title": "Backend Software Engineer"},
-        discovered_at=_timestamp(),
+        discovered_at=_TIMESTAMP,
         hash="sourcehash123",
     )
 
@@ -66,63 +80,87 @@ def test_job_source_model_validation() -> None:
 
 def test_trust_event_model_validation() -> None:
     trust_event = TrustEventModel(
-        id=uuid4(),
+        id=_ID_A,
         domain_root="example.com",
         url="https://example.com",
         score=85,
         signals=[{"signal": "tls", "value": "hsts"}],
         verdict=TrustVerdict.AUTO_SAFE,
-        created_at=_timestamp(),
+        created_at=_TIMESTAMP,
     )
 
     assert trust_event.score == 85
 
 
-def test_whitelist_model_validation() -> None:
+def test_whitelist_model_coerces_timestamp() -> None:
     whitelist_entry = WhitelistModel(
         domain_root="example.com",
         company_name="Example Corp",
         ats_type="greenhouse",
         approved_by="admin",
-        approved_at=_timestamp(),
+        approved_at="2025-01-01T00:00:00Z",
     )
 
-    assert whitelist_entry.company_name == "Example Corp"
+    assert whitelist_entry.approved_at == _TIMESTAMP
 
 
-def test_application_model_validation() -> None:
+def test_application_model_coerces_ids_and_enums() -> None:
     application = ApplicationModel(
-        id=uuid4(),
+        id=str(_ID_A),
+        human_id="APP-2024-001",
+        job_id=str(_ID_B),
+        status="Queued",
+        slack_channel_id="C1234567890",
+        slack_thread_ts="1700000000.123456",
+        score=92.5,
+        canonical_job_id="GH:12345",
+        submission_mode="ats",
+        created_at=_TIMESTAMP,
+        updated_at=_TIMESTAMP,
+    )
+
+    assert application.id == _ID_A
+    assert application.job_id == _ID_B
+    assert application.status is ApplicationStatus.QUEUED
+    assert application.submission_mode is SubmissionMode.ATS
+
+
+def test_application_model_json_round_trip() -> None:
+    # Inputs are already typed and validation is covered above; this checks
+    # that JSON output parses back to the same model.
+    application = ApplicationModel.model_construct(
+        id=_ID_A,
         human_id="APP-2024-001",
-        job_id=uuid4(),
+        job_id=_ID_B,
         status=ApplicationStatus.QUEUED,
         slack_channel_id="C1234567890",
         slack_thread_ts="1700000000.123456",
         score=92.5,
         canonical_job_id="GH:12345",
         submission_mode=SubmissionMode.ATS,
-        created_at=_timestamp(),
-        updated_at=_timestamp(),
+        created_at=_TIMESTAMP,
+        updated_at=_TIMESTAMP,
     )
 
-    assert application.status is ApplicationStatus.QUEUED
+    assert ApplicationModel.model_validate_json(application.model_dump_json()) == application
 
 
 def test_artifact_model_validation() -> None:
     artifact = ArtifactModel(
-        id=uuid4(),
-        application_id=uuid4(),
+        id=_ID_A,
+        application_id=_ID_B,
         type=ArtifactType.JD_SNAPSHOT,
         uri="https://storage.example.com/jd_snapshot.pdf",
-        created_at=_timestamp(),
+        created_at=_TIMESTAMP,
     )
 
     assert artifact.type is ArtifactType.JD_SNAPSHOT
 
 
-def test_profile_models_validation() -> None:
-    identity = ProfileIdentityModel(
-        id=uuid4(),
+@pytest.fixture(scope="module")
+def identity() -> ProfileIdentityModel:
+    return ProfileIdentityModel(
+        id=_ID_A,
         name="Apoorva Chilukuri",
         preferred_name="Apoorva",
         email="apoorva@example.com",
@@ -130,40 +168,49 @@ def test_profile_models_validation() -> None:
         base_location="San Francisco, CA",
     )
 
+
+def test_profile_identity(identity: ProfileIdentityModel) -> None:
+    assert identity.preferred_name == "Apoorva"
+
+
+def test_profile_links(identity: ProfileIdentityModel) -> None:
     links = ProfileLinksModel(
-        id=uuid4(),
+        id=_ID_B,
         identity_id=identity.id,
         linkedin="https://linkedin.com/in/apoorva",
         github="https://github.com/apoorvachilukuri",
         portfolio="https://apoorva.dev",
     )
 
+    assert links.identity_id == identity.id
+
+
+def test_profile_facts(identity: ProfileIdentityModel) -> None:
     facts = ProfileFactsModel(
-        id=uuid4(),
+        id=_ID_C,
         identity_id=identity.id,
-        skills=["Python", "SQL", "FastAPI"],
-        tools=["Docker", "Git"],
-        frameworks=["FastAPI", "SQLAlchemy"],
-        projects=[
-            {"name": "RAG Eval", "one_liner": "Evaluated RAG pipelines", "metric": "20% faster"}
-        ],
+        skills=_SKILLS,
+        tools=_TOOLS,
+        frameworks=_FRAMEWORKS,
+        projects=_PROJECTS,
         education="BS Computer Science",
         work_auth="US Citizen",
     )
 
+    assert len(facts.projects) == 1
+
+
+def test_profile_files(identity: ProfileIdentityModel) -> None:
     resume_variant = ResumeVariantModel(
         label="General",
         uri="https://storage.example.com/resume.pdf",
-        created_at=_timestamp(),
+        created_at=_TIMESTAMP,
     )
 
     files = ProfileFilesModel(
-        id=uuid4(),
+        id=_ID_D,
         identity_id=identity.id,
         resume_variants=[resume_variant],
     )
 
-    assert identity.preferred_name == "Apoorva"
-    assert links.identity_id == identity.id
-    assert len(facts.projects) == 1
     assert files.resume_variants[0].label == "General"